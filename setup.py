@@ -10,19 +10,30 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=[
-        "requests>=2.31.0",
         "beautifulsoup4>=4.12.2",
         "pydantic>=2.5.0",
         "aiohttp>=3.9.1",
+        "aiolimiter>=1.1.0",
+        "uvloop>=0.18.0; sys_platform != 'win32'",
         "tenacity>=8.2.3",
         "lxml>=4.9.3",
         "python-dotenv>=1.0.0",
         "pyyaml>=6.0.1",
+        "orjson>=3.9.0",
+        "numpy>=1.24.0",
         "pandas>=2.1.4",
+        "charset-normalizer>=3.0.0",
         "click>=8.1.7",
         "colorama>=0.4.6",
         "tqdm>=4.66.1",
     ],
+    extras_require={
+        # Optional accelerators for CSV import
+        "fast": [
+            "pyarrow>=14.0.0",
+            "numba>=0.59.0",
+        ],
+    },
     python_requires=">=3.9",
     entry_points={
         "console_scripts": [
@@ -12,11 +12,29 @@ Usage:
     from src.scrapers import BGPHEScraper, CompanyWebsiteScraper
 """
 
-# Import main classes for easy access
-from src.main import ASNAnalyzer
-from src.models.data_models import ASInfo, CompanyInfo, ASRecord
-from src.scrapers.bgp_scraper import BGPHEScraper
-from src.scrapers.company_scraper import CompanyWebsiteScraper
+import importlib
+
+# Main classes are imported on first access (PEP 562) so that importing the
+# package, e.g. via run.py, does not pull in aiohttp, bs4, pydantic and pandas
+_LAZY_IMPORTS = {
+    'ASNAnalyzer': 'src.main',
+    'ASInfo': 'src.models.data_models',
+    'CompanyInfo': 'src.models.data_models',
+    'ASRecord': 'src.models.data_models',
+    'BGPHEScraper': 'src.scrapers.bgp_scraper',
+    'CompanyWebsiteScraper': 'src.scrapers.company_scraper',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 # Package metadata
 __version__ = "1.0.0"
@@ -47,7 +65,7 @@ __all__ = [
 # Optional: Add package-level configuration
 DEFAULT_CONFIG = {
     'request_timeout': 15,
-    'rate_limit_delay': 2,
+    'bgp_requests_per_second': 5,
     'max_retries': 3,
     'output_format': 'json',
     'user_agent': 'ASNAnalyzer/1.0'
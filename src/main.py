@@ -1,32 +1,66 @@
 # src/main.py 
 import asyncio
-import json
+import multiprocessing
+import os
+import re
+import aiohttp
 import click
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, BinaryIO
 from pathlib import Path
 from pydantic import HttpUrl
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 from src.models.data_models import ASRecord
 from src.scrapers.bgp_scraper import BGPHEScraper
 from src.scrapers.company_scraper import CompanyWebsiteScraper
 from src.utils.tracker import ProcessingTracker
-from src.utils.csv_processor import CSVProcessor
+from src.utils.dns_cache import DNSCache
+from src.utils.html_cache import HTMLCache
 from src.utils.validators import ASNValidator
 
+# Plain ASNs (the common case) are checked with one C-level match
+_ASN_RE = re.compile(r'[0-9]{1,10}')
+
 class ASNAnalyzer:
-    def __init__(self):
-        self.bgp_scraper = BGPHEScraper()
-        self.company_scraper = CompanyWebsiteScraper()
+    def __init__(self, max_concurrency: int = 16, use_cache: bool = True):
+        # HTML parsing is CPU-bound, so it runs in worker processes and leaves
+        # the event loop free to drive network I/O. Workers are spawned, not
+        # forked: the pool starts them lazily, after the resolver's threads exist
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn')
+        )
+        # Raw pages are cached on disk so re-runs and re-parses skip the network
+        self.html_cache = HTMLCache() if use_cache else None
+        self.bgp_scraper = BGPHEScraper(executor=self._parse_pool, cache=self.html_cache)
+        self.company_scraper = CompanyWebsiteScraper(executor=self._parse_pool, cache=self.html_cache)
         self.tracker = ProcessingTracker()
         self.validator = ASNValidator()
+        self.dns_cache = DNSCache()
+        # Number of workers in each stage of the scrape pipeline
+        self.max_concurrency = max_concurrency
     
     async def process_asn_list(self, asn_list: List[str], output_file: str = None, force_reprocess: bool = False):
-        """Process a list of ASNs with incremental processing support"""
+        """
+        Process a list of ASNs with incremental processing support
+        Records are appended to a JSON Lines file as they complete
+        Returns: path of the output file, or None if there was nothing to do
+        """
         # Generate unique output filename if not provided
         if output_file is None:
             output_file = self.tracker.generate_output_filename()
         
+        # Results are streamed one record per line
+        output_path = Path(output_file)
+        if output_path.suffix == '.json':
+            output_file = str(output_path.with_suffix('.jsonl'))
+        
         # Ensure output directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         
@@ -56,114 +90,170 @@ class ASNAnalyzer:
         if not new_asns:
             print("✅ All requested ASNs have already been processed!")
             print("💡 Use --force to reprocess all ASNs")
-            return []
+            return None
         
-        results = []
-        successful_count = 0
-        failed_count = 0
+        self._successful = 0
+        self._failed = 0
+        self._completed = 0
+        
+        try:
+            with open(output_file, 'ab') as out:
+                # Two-stage pipeline: BGP workers feed company workers through a
+                # queue, so one ASN's company fetch overlaps the next ASN's BGP
+                # fetch. Each stage runs max_concurrency workers.
+                asn_queue: asyncio.Queue = asyncio.Queue()
+                for i, asn in enumerate(new_asns, 1):
+                    asn_queue.put_nowait((i, asn))
+                company_queue: asyncio.Queue = asyncio.Queue()
+                
+                # bgp.he.net gets its own connector so at most four connections
+                # are ever open against that single upstream
+                async with self._create_session(limit_per_host=4) as bgp_session, \
+                        self._create_session(limit_per_host=10) as company_session:
+                    company_workers = [
+                        asyncio.create_task(self._company_worker(company_queue, company_session, out))
+                        for _ in range(self.max_concurrency)
+                    ]
+                    await asyncio.gather(*(
+                        self._bgp_worker(asn_queue, company_queue, len(new_asns), bgp_session, out)
+                        for _ in range(self.max_concurrency)
+                    ))
+                    # One sentinel per company worker once every BGP result is queued
+                    for _ in company_workers:
+                        company_queue.put_nowait(None)
+                    await asyncio.gather(*company_workers)
+                self.dns_cache.save()
+        except IOError as e:
+            print(f"❌ Error writing results: {e}")
+            raise
+        finally:
+            # Compact and fsync the tracking state once, even if interrupted
+            self.tracker.save_progress(force=True)
+        
+        print("\n" + "="*60)
+        print("📊 FINAL SUMMARY")
+        print("="*60)
+        print(f"✅ Successful: {self._successful}")
+        print(f"❌ Failed: {self._failed}")
+        print(f"📁 Output file: {output_file}")
+        print(f"🕒 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("="*60)
         
-        for i, asn in enumerate(new_asns, 1):
-            print(f"\nProcessing AS{asn}... ({i}/{len(new_asns)})")
+        return output_file
+    
+    def close(self):
+        """Shut down the parser worker processes and flush outstanding tracker marks"""
+        self._parse_pool.shutdown()
+        self.tracker.close()
+    
+    def _write_record(self, out: BinaryIO, record: dict):
+        """Append one record to the JSON Lines output and flush it to disk"""
+        # orjson handles datetimes natively; pydantic URLs fall back to str
+        out.write(orjson.dumps(record, default=str) + b'\n')
+        out.flush()
+    
+    def _create_session(self, limit_per_host: int) -> aiohttp.ClientSession:
+        """Create a pooled keep-alive session shared across scrapes"""
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=30,
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            resolver=self.dns_cache.resolver(),
+        )
+        return aiohttp.ClientSession(connector=connector)
+    
+    async def _bgp_worker(self, asn_queue: asyncio.Queue, company_queue: asyncio.Queue,
+                          total: int, session: aiohttp.ClientSession, out: BinaryIO):
+        """Stage A: scrape BGP info for queued ASNs and hand them to the company stage"""
+        while True:
+            try:
+                index, asn = asn_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            print(f"\nProcessing AS{asn}... ({index}/{total})")
+            try:
+                bgp_info = await self.bgp_scraper.scrape_as_info(asn, session)
+            except Exception as e:
+                self._record_failure(asn, e, out)
+                continue
+            await company_queue.put((asn, bgp_info))
+    
+    async def _company_worker(self, company_queue: asyncio.Queue,
+                              session: aiohttp.ClientSession, out: BinaryIO):
+        """Stage B: scrape company websites and write the finished records"""
+        while True:
+            item = await company_queue.get()
+            if item is None:
+                return
+            asn, bgp_info = item
             
             try:
-                # Scrape BGP information
-                bgp_info = self.bgp_scraper.scrape_as_info(asn)
-                
                 # Scrape company website if available
                 company_info = None
                 if bgp_info.company_website:
-                    company_info = self.company_scraper.scrape_company_info(
-                        str(bgp_info.company_website)
+                    company_info = await self.company_scraper.scrape_company_info(
+                        str(bgp_info.company_website), session
                     )
                 
-                # Create record
-                record = ASRecord(
+                # Create record; its parts are already validated models, so
+                # skip re-validating them
+                record = ASRecord.model_construct(
                     asn=asn,
                     bgp_info=bgp_info,
                     company_info=company_info,
                     scraped_at=datetime.now()
                 )
-                
-                # Convert to serializable format
-                serializable_record = self._make_serializable(record.model_dump())
-                results.append(serializable_record)
+                self._write_record(out, record.model_dump())
                 
                 # Mark as processed
                 self.tracker.mark_asn_processed(asn)
-                successful_count += 1
                 
                 print(f"✅ Successfully processed AS{asn}")
+                self._successful += 1
+                self._record_completed()
                 
             except Exception as e:
-                print(f"❌ Error processing AS{asn}: {e}")
-                # Add error record for debugging
-                error_record = {
-                    "asn": asn,
-                    "error": str(e),
-                    "scraped_at": datetime.now().isoformat()
-                }
-                results.append(error_record)
-                failed_count += 1
-            
-            # Save progress periodically
-            if i % 5 == 0:  # Save every 5 ASNs
-                self.tracker.save_progress()
-            
-            # Rate limiting
-            await asyncio.sleep(2)
-        
-        # Final save
-        self.tracker.save_progress()
-        
-        # Save results to JSON
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            
-            print("\n" + "="*60)
-            print("📊 FINAL SUMMARY")
-            print("="*60)
-            print(f"✅ Successful: {successful_count}")
-            print(f"❌ Failed: {failed_count}")
-            print(f"📁 Output file: {output_file}")
-            print(f"🕒 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print("="*60)
-            
-            return results
-            
-        except Exception as e:
-            print(f"❌ Error saving to JSON: {e}")
-            raise
+                self._record_failure(asn, e, out)
     
-    def _make_serializable(self, obj):
-        """Convert Pydantic objects to JSON-serializable format"""
-        if hasattr(obj, 'model_dump'):
-            return self._make_serializable(obj.model_dump())
-        elif isinstance(obj, dict):
-            return {key: self._make_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, '__str__') and 'pydantic' in str(type(obj)):
-            return str(obj)
-        else:
-            return obj
+    def _record_failure(self, asn: str, error: Exception, out: BinaryIO):
+        """Report a failed ASN and add an error record for debugging"""
+        print(f"❌ Error processing AS{asn}: {error}")
+        self._write_record(out, self._error_record(asn, error))
+        self._failed += 1
+        self._record_completed()
+    
+    def _record_completed(self):
+        """Count a finished ASN and save progress periodically"""
+        self._completed += 1
+        if self._completed % 200 == 0:  # Flush the tracker every 200 ASNs
+            self.tracker.save_progress()
+    
+    def _error_record(self, asn: str, error: BaseException) -> dict:
+        """Build the error entry written for an ASN that failed"""
+        return {
+            "asn": asn,
+            "error": str(error),
+            "scraped_at": datetime.now()
+        }
 
 @click.command()
 @click.option('--asn-file', '-f', help='File containing ASN list (one per line)')
 @click.option('--asn-list', '-l', help='Comma-separated ASN list')
-@click.option('--output', '-o', help='Output JSON file (auto-generated if not specified)')
+@click.option('--output', '-o', help='Output JSON Lines file (auto-generated if not specified)')
 @click.option('--csv-import', is_flag=True, help='Import ASNs from CSV file')
 @click.option('--force', is_flag=True, help='Force reprocessing of all ASNs')
 @click.option('--reset-tracking', is_flag=True, help='Reset ASN tracking database')
-def cli(asn_file, asn_list, output, csv_import, force, reset_tracking):
+@click.option('--no-cache', is_flag=True, help='Always fetch pages instead of using the HTML cache')
+def cli(asn_file, asn_list, output, csv_import, force, reset_tracking, no_cache):
     """ASN Analyzer CLI Tool - Enhanced with Incremental Processing"""
     
     print("🔍 ASN Analyzer - BGP and Company Information Tool")
     print("="*60)
     
-    analyzer = ASNAnalyzer()
+    analyzer = ASNAnalyzer(use_cache=not no_cache)
     
     # Handle reset tracking
     if reset_tracking:
@@ -172,6 +262,8 @@ def cli(asn_file, asn_list, output, csv_import, force, reset_tracking):
     
     # Handle CSV import
     if csv_import:
+        # Imported here so runs without --csv-import never load pandas
+        from src.utils.csv_processor import CSVProcessor
         csv_processor = CSVProcessor()
         imported_asns = csv_processor.process_csv_import()
         if imported_asns:
@@ -198,12 +290,17 @@ def cli(asn_file, asn_list, output, csv_import, force, reset_tracking):
         asns = ["61855", "267548", "13335"]
         print("⚠️  Using default ASN list for demo")
     
-    # Validate ASNs
+    # Validate ASNs in one pass; only non-plain input (AS prefix, ASDOT,
+    # garbage) goes through the full normalizer
     valid_asns = []
     invalid_asns = []
+    validator = analyzer.validator
     
     for asn in asns:
-        normalized, suggestion = analyzer.validator.validate_and_suggest(asn)
+        if _ASN_RE.fullmatch(asn) and validator.is_valid_asn(asn):
+            valid_asns.append(asn)
+            continue
+        normalized, suggestion = validator.validate_and_suggest(asn)
         if normalized:
             valid_asns.append(normalized)
         else:
@@ -222,8 +319,11 @@ def cli(asn_file, asn_list, output, csv_import, force, reset_tracking):
     
     print(f"✅ Processing {len(valid_asns)} valid ASNs")
     
+    # Prefer the libuv-based uvloop event loop when it is installed
+    run = uvloop.run if uvloop is not None else asyncio.run
+    
     try:
-        asyncio.run(analyzer.process_asn_list(valid_asns, output, force))
+        run(analyzer.process_asn_list(valid_asns, output, force))
         print("🎉 Analysis completed successfully!")
     except KeyboardInterrupt:
         print("\n⏹️  Analysis interrupted by user")
@@ -231,6 +331,8 @@ def cli(asn_file, asn_list, output, csv_import, force, reset_tracking):
     except Exception as e:
         print(f"❌ Analysis failed: {e}")
         raise
+    finally:
+        analyzer.close()
 
 def main():
     """Entry point for the application"""
@@ -0,0 +1,45 @@
+# src\scrapers\base_scraper.py
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.utils.html_cache import HTMLCache
+
+class BaseScraper:
+    """Page fetching and parse dispatch shared by the scrapers"""
+
+    def __init__(self, headers: Dict[str, str], timeout: aiohttp.ClientTimeout,
+                 executor: Optional[Executor] = None, cache: Optional[HTMLCache] = None):
+        self.headers = headers
+        self.timeout = timeout
+        # Pool used for the CPU-bound parse; parse inline on the loop if None
+        self.executor = executor
+        # On-disk page cache; always fetch if None
+        self.cache = cache
+
+    async def _fetch(self, url: str, session: aiohttp.ClientSession, limiter: AsyncLimiter,
+                     **kwargs) -> Tuple[bytes, Optional[str]]:
+        """
+        Get a page from the cache, or fetch it under the given rate limiter and cache it
+        Returns: (content, charset declared by the server)
+        """
+        cached = self.cache.get(url) if self.cache else None
+        if cached:
+            return cached
+
+        await limiter.acquire()
+        async with session.get(url, headers=self.headers, timeout=self.timeout, **kwargs) as response:
+            response.raise_for_status()
+            content = await response.read()
+            charset = response.charset
+        if self.cache:
+            self.cache.set(url, content, charset)
+        return content, charset
+
+    async def _parse(self, parse_func: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Run a module-level parse function in the executor, or inline without one"""
+        if self.executor is None:
+            return parse_func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_func, *args)
@@ -1,37 +1,64 @@
 # src\scrapers\bgp_scraper.py
-import requests
+import aiohttp
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
 import re
+from concurrent.futures import Executor
 from typing import Optional
 from src.models.data_models import ASInfo
+from src.scrapers.base_scraper import BaseScraper
+from src.utils.html_cache import HTMLCache
 
-class BGPHEScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+_HTTP_HREF_RE = re.compile(r'^http')
+
+# Labelled numeric fields on the AS info page, fused into one alternation so
+# the page text is scanned once; each field's value lands in "<field>_val"
+_FIELDS = (
+    ('prefixes_originated_all', r'Prefixes Originated \(all\):\s*', r'[\d,]+'),
+    ('prefixes_originated_v4', r'Prefixes Originated \(v4\):\s*', r'[\d,]+'),
+    ('prefixes_originated_v6', r'Prefixes Originated \(v6\):\s*', r'[\d,]+'),
+    ('rpki_valid_all', r'RPKI Originated Valid \(all\):\s*', r'[\d,]+'),
+    ('rpki_invalid_all', r'RPKI Originated Invalid \(all\):\s*', r'[\d,]+'),
+    ('bgp_peers_observed_all', r'BGP Peers Observed \(all\):\s*', r'[\d,]+'),
+    ('ips_originated_v4', r'IPs Originated \(v4\):\s*', r'[\d,]+'),
+    ('avg_path_length_all', r'Average AS Path Length \(all\):\s*', r'[\d.]+'),
+)
+_FIELDS_RE = re.compile('|'.join(
+    f'(?P<{field}>{label}(?P<{field}_val>{value}))' for field, label, value in _FIELDS
+))
+_FIELD_CASTS = {'avg_path_length_all': float}
+
+class BGPHEScraper(BaseScraper):
+    def __init__(self, requests_per_second: float = 5, executor: Optional[Executor] = None,
+                 cache: Optional[HTMLCache] = None):
+        super().__init__(
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            timeout=aiohttp.ClientTimeout(total=10),
+            executor=executor,
+            cache=cache
+        )
+        # Token bucket shared by every concurrent scrape against bgp.he.net
+        self.limiter = AsyncLimiter(max_rate=requests_per_second, time_period=1)
     
-    def scrape_as_info(self, asn: str) -> ASInfo:
-        """Scrape AS information from bgp.he.net"""
+    async def scrape_as_info(self, asn: str, session: aiohttp.ClientSession) -> ASInfo:
+        """Scrape AS information from bgp.he.net using a shared session"""
         url = f"https://bgp.he.net/AS{asn}#_asinfo"
         
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            return self._parse_as_info(soup, asn)
+            content, _ = await self._fetch(url, session, self.limiter)
+            data = await self._parse(_parse_as_info_bytes, content, asn)
+            return ASInfo(**data)
         except Exception as e:
             print(f"Error scraping AS{asn}: {e}")
             return ASInfo(asn=asn)
     
-    def _parse_as_info(self, soup: BeautifulSoup, asn: str) -> ASInfo:
-        """Parse AS information from HTML"""
+    @staticmethod
+    def _parse_as_info(soup: BeautifulSoup, asn: str) -> dict:
+        """Parse AS information from HTML into ASInfo fields"""
         data = {"asn": asn}
         
         # Extract company website
-        website_link = soup.find('a', href=re.compile(r'^http'))
+        website_link = soup.find('a', href=_HTTP_HREF_RE)
         if website_link:
             data['company_website'] = website_link.get('href')
         
@@ -40,27 +67,25 @@ class BGPHEScraper:
         if country_img:
             data['country'] = country_img.get('alt')
         
-        # Extract numerical data using regex patterns
-        text_content = soup.get_text()
+        # Extract numerical data from the AS info block only, falling back to
+        # the whole page if the block is missing
+        container = soup.select_one('#asinfo') or soup
+        text_content = container.get_text(' ', strip=True)
         
-        patterns = {
-            'prefixes_originated_all': r'Prefixes Originated \(all\):\s*(\d+)',
-            'prefixes_originated_v4': r'Prefixes Originated \(v4\):\s*(\d+)',
-            'prefixes_originated_v6': r'Prefixes Originated \(v6\):\s*(\d+)',
-            'rpki_valid_all': r'RPKI Originated Valid \(all\):\s*(\d+)',
-            'rpki_invalid_all': r'RPKI Originated Invalid \(all\):\s*(\d+)',
-            'bgp_peers_observed_all': r'BGP Peers Observed \(all\):\s*(\d+)',
-            'ips_originated_v4': r'IPs Originated \(v4\):\s*([\d,]+)',
-            'avg_path_length_all': r'Average AS Path Length \(all\):\s*([\d.]+)',
-        }
+        for match in _FIELDS_RE.finditer(text_content):
+            field = match.lastgroup
+            if field in data:  # Keep the first occurrence of each field
+                continue
+            value = match.group(f'{field}_val').replace(',', '')
+            try:
+                data[field] = _FIELD_CASTS.get(field, int)(value)
+            except ValueError:
+                continue
         
-        for field, pattern in patterns.items():
-            match = re.search(pattern, text_content)
-            if match:
-                value = match.group(1).replace(',', '')
-                if field == 'avg_path_length_all':
-                    data[field] = float(value)
-                else:
-                    data[field] = int(value)
-        
-        return ASInfo(**data)
+        return data
+
+def _parse_as_info_bytes(html: bytes, asn: str) -> dict:
+    """Parse a raw AS page; module-level so it can run in a worker process"""
+    # bgp.he.net serves UTF-8; skip BeautifulSoup's encoding detection
+    soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8')
+    return BGPHEScraper._parse_as_info(soup, asn)
@@ -1,36 +1,78 @@
 # src\scrapers\company_scraper.py
-import requests
+import aiohttp
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
 import re
-from typing import Optional, List
+from concurrent.futures import Executor
+from typing import Optional, List, Dict
 from urllib.parse import urljoin, urlparse
 from src.models.data_models import CompanyInfo
+from src.scrapers.base_scraper import BaseScraper
+from src.utils.html_cache import HTMLCache
 
-class CompanyWebsiteScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+_ADDRESS_RE = re.compile(
+    r'\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)[,\s]+\w+',
+    re.IGNORECASE
+)
+
+# Service keywords matched in one pass over the lowercased page text. Longer
+# keywords come first so "telecommunications" is not cut short at "telecom";
+# only the leading edge is anchored so plurals like "networks" still count
+_SERVICE_KEYWORDS = [
+    'internet', 'hosting', 'cloud', 'vpn', 'fiber',
+    'broadband', 'datacenter', 'colocation', 'managed',
+    'telecom', 'telecommunications', 'network', 'connectivity',
+    'wireless', 'cable', 'dsl', 'dedicated', 'bandwidth'
+]
+_SERVICES_RE = re.compile(
+    r'\b(' + '|'.join(sorted(_SERVICE_KEYWORDS, key=len, reverse=True)) + ')'
+)
+
+class CompanyWebsiteScraper(BaseScraper):
+    def __init__(self, requests_per_second_per_host: float = 2, executor: Optional[Executor] = None,
+                 cache: Optional[HTMLCache] = None):
+        super().__init__(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            },
+            timeout=aiohttp.ClientTimeout(total=15),
+            executor=executor,
+            cache=cache
+        )
+        # One token bucket per company host, created on first use
+        self.requests_per_second_per_host = requests_per_second_per_host
+        self._host_limiters: Dict[str, AsyncLimiter] = {}
     
-    def scrape_company_info(self, website_url: str) -> Optional[CompanyInfo]:
-        """Scrape company information from website"""
+    async def scrape_company_info(self, website_url: str, session: aiohttp.ClientSession) -> Optional[CompanyInfo]:
+        """Scrape company information from website using a shared session"""
         try:
             # Clean URL
             if not website_url.startswith(('http://', 'https://')):
                 website_url = 'http://' + website_url
             
-            response = self.session.get(website_url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            return self._extract_company_data(soup, website_url)
+            content, charset = await self._fetch(
+                website_url, session, self._limiter_for(website_url), allow_redirects=True
+            )
+            data = await self._parse(_parse_company_bytes, content, charset, website_url)
+            return CompanyInfo(**data)
         except Exception as e:
             print(f"Error scraping {website_url}: {e}")
             return None
     
-    def _extract_company_data(self, soup: BeautifulSoup, url: str) -> CompanyInfo:
-        """Extract relevant company information"""
+    def _limiter_for(self, url: str) -> AsyncLimiter:
+        """Get the rate limiter for the host serving a URL"""
+        host = urlparse(url).hostname or url
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = AsyncLimiter(max_rate=self.requests_per_second_per_host, time_period=1)
+            self._host_limiters[host] = limiter
+        return limiter
+    
+    @staticmethod
+    def _extract_company_data(soup: BeautifulSoup, url: str) -> dict:
+        """Extract relevant company information into CompanyInfo fields"""
         
         # Extract title
         title = soup.find('title')
@@ -40,10 +82,12 @@ class CompanyWebsiteScraper:
         meta_desc = soup.find('meta', attrs={'name': 'description'})
         description = meta_desc.get('content').strip() if meta_desc else None
         
+        # Walk the DOM once; every text-based extractor below reuses this
+        page_text = soup.get_text(' ', strip=True)
+        page_lower = page_text.lower()
+        
         # Extract contact emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        page_text = soup.get_text()
-        emails = list(set(re.findall(email_pattern, page_text)))
+        emails = list(set(_EMAIL_RE.findall(page_text)))
         
         # Filter out common non-contact emails
         filtered_emails = [
@@ -52,45 +96,32 @@ class CompanyWebsiteScraper:
         ]
         
         # Extract phone numbers (improved pattern)
-        phone_pattern = r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        phones = list(set(re.findall(phone_pattern, page_text)))
+        phones = list(set(_PHONE_RE.findall(page_text)))
         phone_numbers = ['-'.join(phone) for phone in phones[:3]]  # Limit to 3
         
         # Extract services (look for common service-related keywords)
-        services = self._extract_services(soup)
+        services = CompanyWebsiteScraper._extract_services(page_lower)
         
         # Extract address (look for address-related content)
-        address = self._extract_address(soup)
+        address = CompanyWebsiteScraper._extract_address(soup, page_text)
         
-        return CompanyInfo(
-            website_url=url,
-            title=title_text,
-            description=description,
-            contact_emails=filtered_emails[:5],  # Limit to 5 emails
-            phone_numbers=phone_numbers,
-            services=services,
-            address=address
-        )
+        return {
+            'website_url': url,
+            'title': title_text,
+            'description': description,
+            'contact_emails': filtered_emails[:5],  # Limit to 5 emails
+            'phone_numbers': phone_numbers,
+            'services': services,
+            'address': address
+        }
     
-    def _extract_services(self, soup: BeautifulSoup) -> List[str]:
-        """Extract service offerings"""
-        service_keywords = [
-            'internet', 'hosting', 'cloud', 'vpn', 'fiber', 
-            'broadband', 'datacenter', 'colocation', 'managed',
-            'telecom', 'telecommunications', 'network', 'connectivity',
-            'wireless', 'cable', 'dsl', 'dedicated', 'bandwidth'
-        ]
-        
-        text = soup.get_text().lower()
-        found_services = []
-        
-        for keyword in service_keywords:
-            if keyword in text:
-                found_services.append(keyword.title())
-        
-        return list(set(found_services))  # Remove duplicates
+    @staticmethod
+    def _extract_services(page_lower: str) -> List[str]:
+        """Extract service offerings from lowercased page text"""
+        return list({match.group(1).title() for match in _SERVICES_RE.finditer(page_lower)})
     
-    def _extract_address(self, soup: BeautifulSoup) -> Optional[str]:
+    @staticmethod
+    def _extract_address(soup: BeautifulSoup, page_text: str) -> Optional[str]:
         """Extract company address"""
         # Look for common address patterns and selectors
         address_selectors = [
@@ -109,10 +140,15 @@ class CompanyWebsiteScraper:
                     return address_text
         
         # Fallback: look for text patterns that look like addresses
-        text = soup.get_text()
-        address_pattern = r'\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)[,\s]+\w+'
-        address_match = re.search(address_pattern, text, re.IGNORECASE)
+        address_match = _ADDRESS_RE.search(page_text)
         if address_match:
             return address_match.group().strip()
         
         return None
+
+def _parse_company_bytes(html: bytes, charset: Optional[str], url: str) -> dict:
+    """Parse a raw company page; module-level so it can run in a worker process"""
+    # Decode with the server-declared charset; without one, BeautifulSoup
+    # still honours a <meta charset> before guessing
+    soup = BeautifulSoup(html, 'lxml', from_encoding=charset)
+    return CompanyWebsiteScraper._extract_company_data(soup, url)
@@ -1,9 +1,26 @@
 # src\utils\__init__.py
 """Utility functions and helpers"""
 
+import importlib
+
 from .helpers import *
-from .tracker import ProcessingTracker
-from .csv_processor import CSVProcessor
-from .validators import ASNValidator
 
-__all__ = ['ProcessingTracker', 'CSVProcessor', 'ASNValidator']
+# Imported on first access (PEP 562); CSVProcessor in particular pulls in pandas
+_LAZY_IMPORTS = {
+    'ProcessingTracker': '.tracker',
+    'CSVProcessor': '.csv_processor',
+    'ASNValidator': '.validators',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+__all__ = ['ProcessingTracker', 'CSVProcessor', 'ASNValidator', 'jsonl_to_json']
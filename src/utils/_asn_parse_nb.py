@@ -0,0 +1,52 @@
+"""
+Numba-compiled ASN parser
+Used by CSVProcessor for string columns when numba is installed
+"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _parse_one(buf, start, end):
+    """Parse one stripped value (65001, AS65001 or 1.1); returns -1 if it is not an ASN"""
+    # Optional "AS" prefix, any case
+    if end - start >= 2 and (buf[start] | 32) == 97 and (buf[start + 1] | 32) == 115:
+        start += 2
+
+    high = 0
+    low = 0
+    high_digits = 0
+    low_digits = -1  # -1 until a dot is seen
+    for i in range(start, end):
+        c = buf[i]
+        if 48 <= c <= 57:
+            if low_digits < 0:
+                high = high * 10 + (c - 48)
+                high_digits += 1
+            else:
+                low = low * 10 + (c - 48)
+                low_digits += 1
+            # Anything this long is out of range anyway; stop before overflow
+            if high_digits > 12 or low_digits > 12:
+                return -1
+        elif c == 46 and low_digits < 0:
+            low_digits = 0
+        else:
+            return -1
+
+    if high_digits == 0 or low_digits == 0:
+        return -1
+    if low_digits > 0:
+        return high * 65536 + low
+    return high
+
+@njit(cache=True)
+def parse_asns(buf, starts, ends):
+    """
+    Parse every value packed into buf (value i is buf[starts[i]:ends[i]])
+    Returns: int64 array of ASNs, -1 where a value could not be parsed
+    """
+    out = np.empty(len(starts), dtype=np.int64)
+    for i in range(len(starts)):
+        out[i] = _parse_one(buf, starts[i], ends[i])
+    return out
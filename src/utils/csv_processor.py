@@ -4,11 +4,35 @@ CSV Processing Module
 Handles CSV file import and ASN extraction
 """
 
+import codecs
+import numpy as np
 import pandas as pd
 import os
+from charset_normalizer import from_bytes
 from pathlib import Path
 from typing import List, Optional, Set
-from .validators import ASNValidator
+from .validators import ASNValidator, ASN_COMBINED_RE
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv  # multithreaded CSV reader for the ASN column
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    from ._asn_parse_nb import parse_asns  # compiled parser for string columns
+except ImportError:
+    parse_asns = None
+
+# Byte-order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
 
 class CSVProcessor:
     def __init__(self):
@@ -48,36 +72,126 @@ class CSVProcessor:
             
             return str(csv_file)
     
+    def _detect_encoding(self, csv_path: str, sample_size: int = 65536) -> str:
+        """Detect a CSV file's encoding from a sample of its first bytes"""
+        with open(csv_path, 'rb') as f:
+            sample = f.read(sample_size)
+        
+        for bom, encoding in _BOMS:
+            if sample.startswith(bom):
+                return encoding
+        
+        try:
+            # Incremental decode so a character cut off at the sample edge is fine
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        best = from_bytes(sample).best()
+        return best.encoding if best else 'iso-8859-1'
+    
+    def _read_csv(self, csv_path: str, **kwargs) -> pd.DataFrame:
+        """Read a CSV file once, using the encoding detected from its first bytes"""
+        encoding = self._detect_encoding(csv_path)
+        try:
+            return pd.read_csv(csv_path, encoding=encoding, **kwargs)
+        except UnicodeDecodeError:
+            # The sample decoded cleanly but later bytes did not; ISO-8859-1
+            # accepts any byte
+            if encoding == 'iso-8859-1':
+                raise
+            return pd.read_csv(csv_path, encoding='iso-8859-1', **kwargs)
+    
+    def _read_csv_pyarrow(self, csv_path: str, column_name: str, columns: List) -> pd.DataFrame:
+        """Read one CSV column as text with pyarrow's multithreaded reader"""
+        # Column names come from pandas, which renames duplicate and blank
+        # headers (ASN.1, Unnamed: 1) where pyarrow would not; select the
+        # column by position under placeholder names instead
+        names = [f"col{i}" for i in range(len(columns))]
+        target = names[columns.index(column_name)]
+        
+        # Typing the column as string up front makes pyarrow validate every
+        # byte (pandas' pyarrow engine would instead return undecodable data
+        # as a binary column) and keeps values from being parsed as numbers
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=[target],
+            column_types={target: pa.string()},
+            strings_can_be_null=True
+        )
+        encoding = self._detect_encoding(csv_path)
+        try:
+            table = pa_csv.read_csv(
+                csv_path, read_options=pa_csv.ReadOptions(encoding=encoding, column_names=names, skip_rows=1),
+                convert_options=convert_options
+            )
+        except pa.ArrowInvalid:
+            # Same fallback as _read_csv: later bytes were not valid in the
+            # encoding detected from the sample
+            if encoding == 'iso-8859-1':
+                raise
+            table = pa_csv.read_csv(
+                csv_path, read_options=pa_csv.ReadOptions(encoding='iso-8859-1', column_names=names, skip_rows=1),
+                convert_options=convert_options
+            )
+        
+        try:
+            # Plain integer columns become int64 so extraction can skip string
+            # parsing; anything else (ASDOT, AS-prefixed, padded) stays text
+            table = pa.table({column_name: table.column(0).cast(pa.int64())})
+        except pa.ArrowInvalid:
+            table = table.rename_columns([column_name])
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
+    def _read_header(self, csv_path: str) -> pd.DataFrame:
+        """Read just the first rows of a file, enough for column names and a preview"""
+        if csv_path.endswith('.csv'):
+            # nrows is not supported by the pyarrow engine, and three rows
+            # parse instantly with the default one
+            return self._read_csv(csv_path, nrows=3)
+        return pd.read_excel(csv_path, nrows=3)
+    
     def load_and_preview_csv(self, csv_path: str) -> Optional[pd.DataFrame]:
-        """Load CSV file and show preview"""
+        """
+        Show the columns and first rows of a file without loading all of it
+        Returns: a small preview DataFrame (use load_column for the data)
+        """
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'iso-8859-1', 'cp1252', 'latin1']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    if csv_path.endswith('.csv'):
-                        df = pd.read_csv(csv_path, encoding=encoding)
-                    else:
-                        df = pd.read_excel(csv_path)
-                    break
-                except UnicodeDecodeError:
-                    continue
+            preview = self._read_header(csv_path)
             
-            if df is None:
-                print("❌ Could not read the file with any supported encoding")
-                return None
-            
-            print(f"\n✅ Successfully loaded CSV file: {csv_path}")
-            print(f"📊 File contains {len(df)} rows and {len(df.columns)} columns")
+            print(f"\n✅ Successfully opened CSV file: {csv_path}")
+            print(f"📊 File contains {len(preview.columns)} columns")
             print("\n📋 Column names:")
-            for i, col in enumerate(df.columns, 1):
+            for i, col in enumerate(preview.columns, 1):
                 print(f"  {i}. {col}")
             
             print(f"\n🔍 First 3 rows preview:")
-            print(df.head(3).to_string(index=False))
+            print(preview.to_string(index=False))
+            
+            return preview
+            
+        except Exception as e:
+            print(f"❌ Error loading CSV file: {e}")
+            return None
+    
+    def load_column(self, csv_path: str, column_name: str,
+                    columns: Optional[List] = None) -> Optional[pd.DataFrame]:
+        """
+        Load only the selected column of a file
+        columns: the column names shown in the preview (read again if omitted)
+        """
+        try:
+            if csv_path.endswith('.csv') and _HAS_PYARROW:
+                if columns is None:
+                    columns = list(self._read_header(csv_path).columns)
+                df = self._read_csv_pyarrow(csv_path, column_name, columns)
+            elif csv_path.endswith('.csv'):
+                # Read as text so ASDOT values like 3.10 are not parsed as floats
+                df = self._read_csv(csv_path, usecols=[column_name], dtype={column_name: str})
+            else:
+                df = pd.read_excel(csv_path, usecols=[column_name], dtype={column_name: str})
             
+            print(f"📊 Loaded {len(df)} rows from column: {column_name}")
             return df
             
         except Exception as e:
@@ -86,6 +200,13 @@ class CSVProcessor:
     
     def prompt_for_column(self, df: pd.DataFrame) -> Optional[str]:
         """Interactive prompt for column selection"""
+        # Lowercase each column name once and index them for O(1) lookups
+        # across retries
+        cols = list(df.columns)
+        lowered = [(str(col).lower(), col) for col in cols]
+        cols_lower = dict(lowered)
+        col_index = {col: i for i, col in enumerate(cols)}
+        
         while True:
             column_input = input("\nEnter the column name or number containing ASNs: ").strip()
             
@@ -96,18 +217,21 @@ class CSVProcessor:
             # Try by number first
             if column_input.isdigit():
                 col_num = int(column_input)
-                if 1 <= col_num <= len(df.columns):
-                    return df.columns[col_num - 1]
+                if 1 <= col_num <= len(cols):
+                    return cols[col_num - 1]
                 else:
-                    print(f"❌ Column number must be between 1 and {len(df.columns)}")
+                    print(f"❌ Column number must be between 1 and {len(cols)}")
                     continue
             
-            # Try by name
-            if column_input in df.columns:
+            # Try by name, then case-insensitively
+            if column_input in col_index:
                 return column_input
+            needle = column_input.lower()
+            if needle in cols_lower:
+                return cols_lower[needle]
             
             # Fuzzy matching
-            similar_cols = [col for col in df.columns if column_input.lower() in col.lower()]
+            similar_cols = [col for col_lower, col in lowered if needle in col_lower]
             if similar_cols:
                 print(f"❓ Did you mean one of these columns?")
                 for i, col in enumerate(similar_cols, 1):
@@ -125,23 +249,40 @@ class CSVProcessor:
         
         print(f"📊 Found {len(column_data)} non-empty values in column")
         
-        # Extract ASNs
-        extracted_asns = []
-        invalid_count = 0
+        if pd.api.types.is_integer_dtype(column_data):
+            # Integer columns already hold ASN values, so skip the string
+            # round-trip (float columns are not safe here: ASDOT 1.1 reads as
+            # a float and needs the text path)
+            asn_num = column_data.astype('int64')
+        elif parse_asns is not None:
+            # Pack the stripped strings into one byte buffer and parse them in
+            # a single compiled loop; unparseable values come back as -1 and
+            # fail the range check below
+            encoded = column_data.astype(str).str.strip().str.encode('utf-8', 'replace').tolist()
+            lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+            ends = np.cumsum(lengths)
+            starts = ends - lengths
+            buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            asn_num = pd.Series(parse_asns(buf, starts, ends), index=column_data.index)
+        else:
+            # Normalize the whole column with vectorized string ops rather than a
+            # per-row Python loop, reusing the validator's compiled pattern; the
+            # second group is only present for ASDOT notation
+            values = column_data.astype(str).str.strip()
+            parts = values.str.extract(ASN_COMBINED_RE)
+            high = pd.to_numeric(parts[0], errors='coerce')
+            low = pd.to_numeric(parts[1], errors='coerce')
+            asn_num = high.where(low.isna(), high * 65536 + low)
         
-        for value in column_data:
-            # Convert to string and clean
-            asn_str = str(value).strip()
-            
-            # Validate and normalize ASN
-            normalized_asn = self.validator.normalize_asn(asn_str)
-            if normalized_asn and self.validator.is_valid_asn(normalized_asn):
-                extracted_asns.append(normalized_asn)
-            else:
-                invalid_count += 1
+        # Keep only ASNs inside the validator's ranges (odd insertion index;
+        # NaN sorts past the end and is rejected)
+        asn_values = asn_num.to_numpy()
+        valid = (np.searchsorted(self.validator.range_boundaries, asn_values, side='right') & 1).astype(bool)
+        invalid_count = len(column_data) - int(valid.sum())
         
-        # Remove duplicates while preserving order
-        unique_asns = list(dict.fromkeys(extracted_asns))
+        # Remove duplicates on the int64 values (hash-based, first-seen order),
+        # converting to strings only once at the end
+        unique_asns = pd.unique(asn_values[valid].astype(np.int64)).astype(str).tolist()
         
         print(f"✅ Extracted {len(unique_asns)} unique valid ASNs")
         if invalid_count > 0:
@@ -157,37 +298,45 @@ class CSVProcessor:
     
     def merge_with_existing_input(self, csv_asns: List[str], input_file: str = "data/input/asn_list.txt") -> List[str]:
         """Merge CSV ASNs with existing input file"""
-        existing_asns = []
+        # Insertion-ordered dict used as an ordered set: existing ASNs first,
+        # then new ones from the CSV, each hashed exactly once
+        seen = {}
+        existing_count = 0
         
         # Read existing ASNs if file exists
         input_path = Path(input_file)
         if input_path.exists():
             try:
                 with open(input_path, 'r', encoding='utf-8') as f:
-                    existing_asns = [line.strip() for line in f if line.strip()]
-                print(f"📂 Loaded {len(existing_asns)} ASNs from existing input file")
+                    for line in f:
+                        asn = line.strip()
+                        if asn:
+                            seen.setdefault(asn, None)
+                            existing_count += 1
+                print(f"📂 Loaded {existing_count} ASNs from existing input file")
             except IOError as e:
                 print(f"⚠️  Warning: Could not read existing input file: {e}")
+        existing_unique = len(seen)
         
         # Combine and deduplicate
-        all_asns = existing_asns + csv_asns
-        unique_asns = list(dict.fromkeys(all_asns))  # Preserve order
+        for asn in csv_asns:
+            seen.setdefault(asn, None)
+        unique_asns = list(seen)  # Preserve order
         
         # Update the input file
         try:
             input_path.parent.mkdir(parents=True, exist_ok=True)
             with open(input_path, 'w', encoding='utf-8') as f:
-                for asn in unique_asns:
-                    f.write(f"{asn}\n")
+                f.write("\n".join(unique_asns) + "\n")
             
             print(f"✅ Updated input file with {len(unique_asns)} total unique ASNs")
-            print(f"   - Previous: {len(existing_asns)} ASNs")
+            print(f"   - Previous: {existing_count} ASNs")
             print(f"   - From CSV: {len(csv_asns)} ASNs")
             print(f"   - Total: {len(unique_asns)} ASNs")
             
         except IOError as e:
             print(f"❌ Error updating input file: {e}")
-            return existing_asns  # Return original list if update fails
+            return unique_asns[:existing_unique]  # Return original ASNs if update fails
         
         return unique_asns
     
@@ -198,16 +347,20 @@ class CSVProcessor:
         if not csv_path:
             return None
         
-        # Step 2: Load and preview CSV
-        df = self.load_and_preview_csv(csv_path)
-        if df is None:
+        # Step 2: Preview CSV
+        preview = self.load_and_preview_csv(csv_path)
+        if preview is None:
             return None
         
-        # Step 3: Select column
-        column_name = self.prompt_for_column(df)
+        # Step 3: Select column, then load only that column
+        column_name = self.prompt_for_column(preview)
         if not column_name:
             return None
         
+        df = self.load_column(csv_path, column_name, list(preview.columns))
+        if df is None:
+            return None
+        
         # Step 4: Extract ASNs
         csv_asns = self.extract_asns_from_column(df, column_name)
         if not csv_asns:
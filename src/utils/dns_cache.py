@@ -0,0 +1,85 @@
+"""
+DNS Cache Module
+Persists hostname resolutions between runs and plugs them into aiohttp
+"""
+
+import json
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+class DNSCache:
+    def __init__(self, cache_file: str = "data/cache/dns.json", ttl: int = 600):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.entries: Dict[str, Dict[str, Any]] = self._load_entries()
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Load unexpired resolutions from the cache file"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            print(f"⚠️  Warning: Could not read DNS cache, starting fresh")
+            return {}
+
+        now = time.time()
+        return {host: entry for host, entry in data.items() if entry.get('expires', 0) > now}
+
+    def get(self, host: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached addresses for a host, or None if missing/expired"""
+        entry = self.entries.get(host)
+        if entry is None:
+            return None
+        if entry['expires'] <= time.time():
+            del self.entries[host]
+            return None
+        return entry['addrs']
+
+    def set(self, host: str, addrs: List[Dict[str, Any]]):
+        """Store resolved addresses for a host"""
+        self.entries[host] = {
+            'addrs': [dict(addr) for addr in addrs],
+            'expires': time.time() + self.ttl
+        }
+
+    def save(self):
+        """Save cached resolutions to disk"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+        except IOError as e:
+            print(f"⚠️  Warning: Could not save DNS cache: {e}")
+
+    def resolver(self) -> "CachingResolver":
+        """Create an aiohttp resolver backed by this cache (call inside the event loop)"""
+        return CachingResolver(self)
+
+class CachingResolver(AbstractResolver):
+    """aiohttp resolver that answers from a DNSCache before asking the system resolver"""
+
+    def __init__(self, cache: DNSCache):
+        self._cache = cache
+        self._resolver = DefaultResolver()
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        addrs = self._cache.get(host)
+        if addrs is not None:
+            if family != socket.AF_UNSPEC:
+                addrs = [addr for addr in addrs if addr['family'] == family]
+            if addrs:
+                return [dict(addr, port=port) for addr in addrs]
+
+        addrs = await self._resolver.resolve(host, port, family)
+        self._cache.set(host, addrs)
+        return addrs
+
+    async def close(self):
+        await self._resolver.close()
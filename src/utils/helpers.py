@@ -1 +1,34 @@
-# src\utils\helpers.py
\ No newline at end of file
+# src\utils\helpers.py
+"""
+Helper Functions
+Small utilities shared across the package
+"""
+
+from pathlib import Path
+from typing import Optional
+
+__all__ = ['jsonl_to_json']
+
+def jsonl_to_json(jsonl_path: str, json_path: Optional[str] = None) -> str:
+    """
+    Convert a JSON Lines results file into a single JSON array
+    Lines are copied through as-is, so the file is never fully loaded
+    Returns: path of the written JSON file
+    """
+    source = Path(jsonl_path)
+    target = Path(json_path) if json_path else source.with_suffix('.json')
+
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        dst.write(b'[')
+        first = True
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                dst.write(b',\n')
+            dst.write(line)
+            first = False
+        dst.write(b']\n')
+
+    return str(target)
@@ -0,0 +1,49 @@
+"""
+HTML Cache Module
+Stores fetched pages on disk so re-runs can skip the network
+"""
+
+import gzip
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+class HTMLCache:
+    def __init__(self, cache_dir: str = "data/cache/html", expire_after: int = 86400):
+        self.cache_dir = Path(cache_dir)
+        self.expire_after = expire_after
+
+    def _path_for(self, url: str) -> Path:
+        """Map a URL to its cache file, sharded by the first two hex digits"""
+        key = hashlib.blake2b(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.html.gz"
+
+    def get(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Look up a cached page
+        Returns: (content, charset), or None if missing or expired
+        """
+        path = self._path_for(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.expire_after:
+                return None
+            with gzip.open(path, 'rb') as f:
+                payload = f.read()
+        except (OSError, EOFError):
+            return None
+
+        # First line holds the charset the server declared (may be empty)
+        charset, _, content = payload.partition(b'\n')
+        return content, charset.decode('ascii') or None
+
+    def set(self, url: str, content: bytes, charset: Optional[str] = None):
+        """Store a fetched page"""
+        path = self._path_for(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            header = (charset or '').encode('ascii', 'ignore') + b'\n'
+            with gzip.open(path, 'wb', compresslevel=1) as f:
+                f.write(header + content)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not cache {url}: {e}")
@@ -4,80 +4,242 @@ ASN Processing Tracker
 Manages processed ASNs and generates unique output filenames
 """
 
-import json
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Set, List, Dict, Any
+from typing import Set, List, Dict, Any, Iterable, Optional, TextIO
+
+import numpy as np
+import orjson
 
 class ProcessingTracker:
-    def __init__(self, tracking_file: str = "data/input/processed_asns.json"):
+    def __init__(self, tracking_file: str = "data/input/processed_asns.log",
+                 flush_every: int = 128, flush_interval: float = 30.0):
+        # Append-only log of processed ASNs, one per line; marking an ASN is a
+        # single line append instead of a rewrite of the whole history
         self.tracking_file = Path(tracking_file)
-        self.processed_asns: Set[str] = self._load_processed_asns()
+        # JSON metadata (last_updated, total) written only on a forced save
+        self.metadata_file = self.tracking_file.with_suffix('.meta.json')
+        # Create the directory once up front instead of on every write
+        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+        self._log_fh: Optional[TextIO] = None
+        # Processed ASNs as a sorted int64 array (8 bytes each, vectorized
+        # membership via searchsorted); new marks sit in _tail until flushed
+        self.processed_asns: np.ndarray = self._load_processed_asns()
+        self._tail: Set[int] = set()
+        
+        # Group commit: marks are batched in memory and appended together once
+        # flush_every accumulate, or on save_progress after flush_interval seconds
+        self._pending: List[str] = []
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+    
+    @staticmethod
+    def _to_sorted_array(asns: Iterable) -> np.ndarray:
+        """Convert ASN strings to a sorted, duplicate-free int64 array"""
+        # Entries that are not plain ASNs (a torn write, a hand edit) are
+        # skipped one by one rather than invalidating the whole history
+        values = (str(asn).strip() for asn in asns)
+        return np.unique(np.fromiter(
+            (int(asn) for asn in values if asn.isascii() and asn.isdigit() and len(asn) <= 10),
+            dtype=np.int64
+        ))
     
-    def _load_processed_asns(self) -> Set[str]:
-        """Load previously processed ASNs from tracking file"""
+    def _load_processed_asns(self) -> np.ndarray:
+        """Load previously processed ASNs from the tracking log"""
         if self.tracking_file.exists():
             try:
-                with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_asns', []))
-            except (json.JSONDecodeError, IOError):
+                with open(self.tracking_file, 'r', encoding='utf-8', errors='replace') as f:
+                    return self._to_sorted_array(f)
+            except IOError:
                 print(f"⚠️  Warning: Could not read tracking file, starting fresh")
-                return set()
-        return set()
+                return np.empty(0, dtype=np.int64)
+        return self._migrate_legacy_tracking()
     
-    def _save_processed_asns(self):
-        """Save processed ASNs to tracking file"""
-        # Ensure directory exists
-        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+    def _migrate_legacy_tracking(self) -> np.ndarray:
+        """Import ASNs from the old JSON tracking file, if present"""
+        legacy_file = self.tracking_file.with_suffix('.json')
+        processed = []
+        
+        if legacy_file.exists():
+            try:
+                with open(legacy_file, 'rb') as f:
+                    processed = orjson.loads(f.read()).get('processed_asns', [])
+            except (orjson.JSONDecodeError, IOError):
+                print(f"⚠️  Warning: Could not read legacy tracking file")
         
-        tracking_data = {
-            'processed_asns': list(self.processed_asns),
+        migrated = self._to_sorted_array(processed)
+        if len(migrated):
+            print(f"📦 Migrated {len(migrated)} ASNs from legacy tracking file")
+            self._write_log(migrated)
+        return migrated
+    
+    def _write_log(self, asns: np.ndarray):
+        """Rewrite the tracking log to contain exactly the given ASNs"""
+        self._close_log()
+        # Stringify the array in one NumPy call and join it straight into the
+        # payload, with no per-ASN formatting or intermediate list
+        data = "\n".join(asns.astype(str)) + "\n" if len(asns) else ""
+        try:
+            self._atomic_write(self.tracking_file, data.encode('ascii'))
+        except IOError as e:
+            print(f"⚠️  Warning: Could not save tracking file: {e}")
+    
+    def _append_to_log(self, asns: List[str]):
+        """Append a batch of processed ASNs to the tracking log in one write"""
+        try:
+            if self._log_fh is None:
+                self._log_fh = open(self.tracking_file, 'a', encoding='utf-8')
+                # Terminate a torn final line so it doesn't merge with the next ASN
+                if self._log_fh.tell() and not self._log_ends_with_newline():
+                    self._log_fh.write("\n")
+            self._log_fh.write("\n".join(asns) + "\n")
+            self._log_fh.flush()
+        except IOError as e:
+            print(f"⚠️  Warning: Could not write tracking file: {e}")
+    
+    def _log_ends_with_newline(self) -> bool:
+        """Check the last byte of the tracking log"""
+        with open(self.tracking_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    def _close_log(self):
+        """Close the tracking log handle if open"""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+    
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write to a temporary file and swap it in, so a crash never leaves a partial file"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _save_metadata(self):
+        """Write the metadata sidecar"""
+        metadata = {
             'last_updated': datetime.now().isoformat(),
-            'total_processed': len(self.processed_asns)
+            'total_processed': len(self.processed_asns) + len(self._tail)
         }
         
         try:
-            with open(self.tracking_file, 'w', encoding='utf-8') as f:
-                json.dump(tracking_data, f, indent=2, ensure_ascii=False)
+            self._atomic_write(self.metadata_file, orjson.dumps(metadata))
         except IOError as e:
-            print(f"⚠️  Warning: Could not save tracking file: {e}")
+            print(f"⚠️  Warning: Could not save tracking metadata: {e}")
     
     def filter_new_asns(self, asn_list: List[str]) -> tuple[List[str], List[str]]:
         """
         Filter ASNs into new and already processed
         Returns: (new_asns, already_processed)
         """
-        new_asns = [asn for asn in asn_list if asn not in self.processed_asns]
-        already_processed = [asn for asn in asn_list if asn in self.processed_asns]
+        self._merge_tail()
+        processed = self.processed_asns
+        if not len(processed) or not asn_list:
+            return list(asn_list), []
+        
+        # One vectorized searchsorted over the whole list instead of a lookup per ASN
+        values = np.fromiter((int(asn) for asn in asn_list), dtype=np.int64, count=len(asn_list))
+        idx = np.searchsorted(processed, values)
+        seen = (idx < len(processed)) & (processed[idx.clip(max=len(processed) - 1)] == values)
+        
+        new_asns, already_processed = [], []
+        new_append, seen_append = new_asns.append, already_processed.append
+        for asn, is_seen in zip(asn_list, seen.tolist()):
+            if is_seen:
+                seen_append(asn)
+            else:
+                new_append(asn)
         return new_asns, already_processed
     
     def mark_asn_processed(self, asn: str):
-        """Mark an ASN as processed"""
-        self.processed_asns.add(asn)
+        """
+        Mark an ASN as processed
+        The mark is buffered and written with its batch, so a hard crash can
+        lose up to flush_every - 1 marks; those ASNs are simply re-scraped on
+        the next run. close() writes anything outstanding; ASNAnalyzer.close()
+        calls it when the CLI exits.
+        """
+        value = int(asn)
+        if value not in self._tail and not self._contains(value):
+            self._tail.add(value)
+            self._pending.append(asn)
+            if len(self._pending) >= self._flush_every:
+                self.flush()
+    
+    def _contains(self, value: int) -> bool:
+        """Binary search the sorted array for one ASN"""
+        processed = self.processed_asns
+        i = np.searchsorted(processed, value)
+        return i < len(processed) and processed[i] == value
     
-    def save_progress(self):
-        """Save current progress to disk"""
-        self._save_processed_asns()
+    def _merge_tail(self):
+        """Fold buffered marks into the sorted array"""
+        if self._tail:
+            # Tail values are never already present, so a sorted insert suffices
+            tail = np.sort(np.fromiter(self._tail, dtype=np.int64, count=len(self._tail)))
+            self.processed_asns = np.insert(self.processed_asns, np.searchsorted(self.processed_asns, tail), tail)
+            self._tail.clear()
+    
+    def flush(self):
+        """Append all buffered marks to the tracking log"""
+        if self._pending:
+            self._append_to_log(self._pending)
+            self._pending = []
+        self._merge_tail()
+        self._last_flush = time.monotonic()
+    
+    def save_progress(self, force: bool = False):
+        """
+        Save current progress to disk
+        A no-op unless marks have been buffered for flush_interval seconds;
+        force=True always flushes, fsyncs the log and writes the metadata sidecar
+        """
+        if force:
+            self.flush()
+            if self._log_fh is not None:
+                os.fsync(self._log_fh.fileno())
+            self._save_metadata()
+        elif self._pending and time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+    
+    def close(self):
+        """Flush everything to disk and release the log handle"""
+        if self._pending or self._log_fh is not None:
+            self.save_progress(force=True)
+        self._close_log()
     
     def generate_output_filename(self, base_dir: str = "data/output") -> str:
         """Generate unique timestamped output filename"""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"asn_results_{timestamp}.json"
+        filename = f"asn_results_{timestamp}.jsonl"
         return os.path.join(base_dir, filename)
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get processing statistics"""
+        """Get processing statistics (use processed_asns_sorted() for the ASNs themselves)"""
         return {
-            'total_processed': len(self.processed_asns),
-            'processed_asns': sorted(list(self.processed_asns)),
+            'total_processed': len(self.processed_asns) + len(self._tail),
             'tracking_file': str(self.tracking_file)
         }
     
+    def processed_asns_sorted(self) -> List[str]:
+        """All processed ASNs in numeric order"""
+        self._merge_tail()
+        return self.processed_asns.astype(str).tolist()
+    
     def reset_tracking(self):
         """Reset all tracking data"""
-        self.processed_asns.clear()
-        if self.tracking_file.exists():
-            self.tracking_file.unlink()
+        self.processed_asns = np.empty(0, dtype=np.int64)
+        self._tail.clear()
+        self._pending.clear()
+        self._close_log()
+        # The legacy file goes too, otherwise the next start would migrate it back
+        legacy_file = self.tracking_file.with_suffix('.json')
+        for path in (self.tracking_file, self.metadata_file, legacy_file):
+            if path.exists():
+                path.unlink()
         print("🔄 Tracking data reset successfully")
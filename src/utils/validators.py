@@ -4,18 +4,16 @@ ASN Validation Module
 Handles ASN format validation and normalization
 """
 
+import bisect
 import re
-from typing import Optional
+from typing import List, Optional
+
+# One pattern covers 65001, AS65001 and 1.1 (ASDOT notation); anchored so it
+# can also be handed to pandas' str.extract, which searches
+ASN_COMBINED_RE = re.compile(r'^(?:AS)?(\d+)(?:\.(\d+))?$', re.IGNORECASE)
 
 class ASNValidator:
     def __init__(self):
-        # ASN format patterns
-        self.patterns = {
-            'plain': re.compile(r'^(\d+)$'),                    # 65001
-            'as_prefix': re.compile(r'^AS(\d+)$', re.I),        # AS65001
-            'asdot': re.compile(r'^(\d+)\.(\d+)$'),            # 1.1 (ASDOT notation)
-        }
-        
         # Valid ASN ranges (RFC 6996, RFC 7300)
         self.valid_ranges = [
             (1, 23455),           # Public ASNs (original)
@@ -24,6 +22,21 @@ class ASNValidator:
             (64512, 65534),       # Private Use (RFC 6996)
             (65536, 4199999999),  # 4-byte ASNs (RFC 6793)
         ]
+        
+        # Flattened, merged [start, end + 1) boundaries: an ASN is valid when
+        # it lands at an odd insertion index
+        self.range_boundaries = self._build_boundaries(self.valid_ranges)
+    
+    @staticmethod
+    def _build_boundaries(ranges) -> List[int]:
+        """Merge inclusive ranges into a sorted list of half-open boundaries"""
+        boundaries: List[int] = []
+        for start, end in sorted(ranges):
+            if boundaries and start <= boundaries[-1]:
+                boundaries[-1] = max(boundaries[-1], end + 1)
+            else:
+                boundaries.extend((start, end + 1))
+        return boundaries
     
     def normalize_asn(self, asn_input: str) -> Optional[str]:
         """
@@ -33,32 +46,25 @@ class ASNValidator:
         if not asn_input or not isinstance(asn_input, str):
             return None
         
-        asn_input = asn_input.strip()
-        
-        # Plain number
-        if self.patterns['plain'].match(asn_input):
-            return asn_input
-        
-        # AS prefix (AS65001)
-        match = self.patterns['as_prefix'].match(asn_input)
-        if match:
-            return match.group(1)
+        match = ASN_COMBINED_RE.fullmatch(asn_input.strip())
+        if not match:
+            return None
         
         # ASDOT notation (1.1)
-        match = self.patterns['asdot'].match(asn_input)
-        if match:
+        if match.group(2) is not None:
             high = int(match.group(1))
             low = int(match.group(2))
             asn_number = (high * 65536) + low
             return str(asn_number)
         
-        return None
+        # Plain number or AS prefix (AS65001)
+        return match.group(1)
     
     def is_valid_asn(self, asn: str) -> bool:
         """Check if ASN is in valid ranges"""
         try:
             asn_num = int(asn)
-            return any(start <= asn_num <= end for start, end in self.valid_ranges)
+            return bool(bisect.bisect_right(self.range_boundaries, asn_num) & 1)
         except (ValueError, TypeError):
             return False
     
@@ -0,0 +1,34 @@
+# tests\test_asn_parsing.py
+import pandas as pd
+import pytest
+
+from src.utils import csv_processor
+from src.utils.csv_processor import CSVProcessor
+
+# Mixed input: plain, AS-prefixed, ASDOT, padded and malformed values
+SAMPLE = [
+    '13335', 'AS15169', 'as64512', '1.10', 'AS1.1', '  65001 ', '\t23456\n', '\xa070000',
+    '1.', '.5', 'AS', '', 'AS 5', '1.1.1', 'x1', 'asn1', '1 2', '١٢',
+    '99999999999999999999', '12345678901234567890.1',
+    '0', '65535', '4199999999', '4200000000', '15169',
+]
+
+EXPECTED = ['13335', '15169', '64512', '65546', '65537', '65001', '23456', '70000', '4199999999']
+
+def _extract(monkeypatch, parser):
+    monkeypatch.setattr(csv_processor, 'parse_asns', parser)
+    df = pd.DataFrame({'asn': SAMPLE})
+    return CSVProcessor().extract_asns_from_column(df, 'asn')
+
+def test_pandas_path(monkeypatch):
+    assert _extract(monkeypatch, None) == EXPECTED
+
+def test_numba_path_matches_pandas_path(monkeypatch):
+    pytest.importorskip('numba')
+    from src.utils._asn_parse_nb import parse_asns
+
+    assert _extract(monkeypatch, parse_asns) == _extract(monkeypatch, None) == EXPECTED
+
+def test_integer_column():
+    df = pd.DataFrame({'asn': [13335, 0, 13335, 70000]})
+    assert CSVProcessor().extract_asns_from_column(df, 'asn') == ['13335', '70000']
@@ -0,0 +1,54 @@
+# tests\test_csv_processor.py
+import pandas as pd
+import pytest
+
+from src.utils import csv_processor
+from src.utils.csv_processor import CSVProcessor
+
+@pytest.fixture(params=[False, True], ids=['c-engine', 'pyarrow'])
+def processor(request, monkeypatch):
+    if request.param:
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(csv_processor, '_HAS_PYARROW', request.param)
+    return CSVProcessor()
+
+def _import_column(processor, csv_path, column_name):
+    preview = processor.load_and_preview_csv(str(csv_path))
+    assert column_name in preview.columns
+    df = processor.load_column(str(csv_path), column_name, list(preview.columns))
+    assert df is not None
+    return processor.extract_asns_from_column(df, column_name)
+
+def test_duplicate_header(processor, tmp_path):
+    csv_path = tmp_path / "dup.csv"
+    csv_path.write_text("ASN,ASN,name\n13335,15169,a\nAS1.10,64512,b\n")
+
+    assert _import_column(processor, csv_path, 'ASN') == ['13335', '65546']
+    assert _import_column(processor, csv_path, 'ASN.1') == ['15169', '64512']
+
+def test_blank_header(processor, tmp_path):
+    csv_path = tmp_path / "blank.csv"
+    csv_path.write_text("name,\na,13335\nb,AS1.1\n")
+
+    assert _import_column(processor, csv_path, 'Unnamed: 1') == ['13335', '65537']
+
+def test_integer_column_stays_numeric_under_pyarrow(monkeypatch, tmp_path):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(csv_processor, '_HAS_PYARROW', True)
+    csv_path = tmp_path / "int.csv"
+    csv_path.write_text("asn\n13335\n\n15169\n13335\n")
+
+    processor = CSVProcessor()
+    df = processor.load_column(str(csv_path), 'asn', ['asn'])
+    assert pd.api.types.is_integer_dtype(df['asn'])
+    assert processor.extract_asns_from_column(df, 'asn') == ['13335', '15169']
+
+def test_asdot_column_stays_text_under_pyarrow(monkeypatch, tmp_path):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(csv_processor, '_HAS_PYARROW', True)
+    csv_path = tmp_path / "asdot.csv"
+    csv_path.write_text("asn\n1.1\n2.5\n3.10\n")
+
+    processor = CSVProcessor()
+    df = processor.load_column(str(csv_path), 'asn', ['asn'])
+    assert processor.extract_asns_from_column(df, 'asn') == ['65537', '131077', '196618']
@@ -1 +1,79 @@
-# tests\test_scrapers.py
\ No newline at end of file
+# tests\test_scrapers.py
+from src.scrapers.bgp_scraper import _parse_as_info_bytes
+from src.scrapers.company_scraper import CompanyWebsiteScraper, _parse_company_bytes
+
+AS_PAGE = b"""
+<html><body>
+  <div id="header">Prefixes Originated (all): 99</div>
+  <div id="asinfo">
+    <a href="http://www.example.net">example.net</a>
+    <img alt="United States" src="/flags/us.gif">
+    <div>Prefixes Originated (all): 1,234</div>
+    <div>Prefixes Originated (v4): 1,000</div>
+    <div>Prefixes Originated (v6): 234</div>
+    <div>BGP Peers Observed (all): 12,345</div>
+    <div>IPs Originated (v4): 1,048,576</div>
+    <div>Average AS Path Length (all): 3.512</div>
+    <div>Prefixes Originated (v6): 999</div>
+  </div>
+</body></html>
+"""
+
+def test_as_info_fields():
+    data = _parse_as_info_bytes(AS_PAGE, '65001')
+
+    assert data['asn'] == '65001'
+    assert data['company_website'] == 'http://www.example.net'
+    assert data['country'] == 'United States'
+    # Comma-grouped integers; text outside #asinfo is ignored
+    assert data['prefixes_originated_all'] == 1234
+    assert data['prefixes_originated_v4'] == 1000
+    assert data['bgp_peers_observed_all'] == 12345
+    assert data['ips_originated_v4'] == 1048576
+    assert data['avg_path_length_all'] == 3.512
+    # A repeated label keeps its first value
+    assert data['prefixes_originated_v6'] == 234
+    # Missing labels are left out
+    assert 'rpki_valid_all' not in data
+
+def test_as_info_without_asinfo_block():
+    page = b"""
+    <html><body>
+      <p>RPKI Originated Valid (all): 2,048</p>
+      <p>RPKI Originated Invalid (all): 0</p>
+      <p>Average AS Path Length (all): 4</p>
+    </body></html>
+    """
+    data = _parse_as_info_bytes(page, '65002')
+
+    assert data['rpki_valid_all'] == 2048
+    assert data['rpki_invalid_all'] == 0
+    assert data['avg_path_length_all'] == 4.0
+
+def test_services_longest_keyword_wins():
+    # "telecommunications" is one match, not also "telecom"
+    assert CompanyWebsiteScraper._extract_services('global telecommunications provider') == ['Telecommunications']
+
+def test_services_match_word_starts_only():
+    # Matches are anchored at the start of a word, so plurals and longer
+    # words count under their prefix but keywords inside a word do not
+    services = CompanyWebsiteScraper._extract_services('internetworking and networks, no subnetting')
+    assert sorted(services) == ['Internet', 'Network']
+
+def test_company_page():
+    page = b"""
+    <html><head>
+      <title> Example Networks </title>
+      <meta name="description" content=" Fiber and cloud hosting ">
+    </head><body>
+      <p>We offer dedicated bandwidth and colocation.</p>
+      <p>Contact sales@acme-net.io</p>
+    </body></html>
+    """
+    data = _parse_company_bytes(page, 'utf-8', 'http://www.acme-net.io/')
+
+    assert data['title'] == 'Example Networks'
+    assert data['description'] == 'Fiber and cloud hosting'
+    assert data['contact_emails'] == ['sales@acme-net.io']
+    # Services come from the page text (title included), not the meta description
+    assert sorted(data['services']) == ['Bandwidth', 'Colocation', 'Dedicated', 'Network']
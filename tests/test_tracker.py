@@ -0,0 +1,33 @@
+# tests\test_tracker.py
+from src.utils.tracker import ProcessingTracker
+
+def test_round_trip(tmp_path):
+    log = tmp_path / "processed_asns.log"
+    tracker = ProcessingTracker(str(log), flush_every=2)
+    for asn in ['65001', '13335', '13335', '15169']:
+        tracker.mark_asn_processed(asn)
+    tracker.flush()
+    tracker.close()
+
+    reloaded = ProcessingTracker(str(log))
+    assert reloaded.processed_asns_sorted() == ['13335', '15169', '65001']
+    assert reloaded.filter_new_asns(['15169', '1', '65001', '2']) == (['1', '2'], ['15169', '65001'])
+    reloaded.close()
+
+def test_unflushed_marks_are_visible(tmp_path):
+    tracker = ProcessingTracker(str(tmp_path / "processed_asns.log"))
+    tracker.mark_asn_processed('13335')
+    assert tracker.filter_new_asns(['13335', '15169']) == (['15169'], ['13335'])
+    assert tracker.get_stats()['total_processed'] == 1
+    tracker.close()
+
+def test_malformed_lines_are_skipped(tmp_path):
+    log = tmp_path / "processed_asns.log"
+    log.write_bytes(b"13335\nAS123\n\xff\n65001")
+
+    tracker = ProcessingTracker(str(log))
+    assert tracker.processed_asns_sorted() == ['13335', '65001']
+    tracker.mark_asn_processed('15169')
+    tracker.close()
+
+    assert ProcessingTracker(str(log)).processed_asns_sorted() == ['13335', '15169', '65001']